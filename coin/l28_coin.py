@@ -3,6 +3,8 @@ L28 COIN - Main Integration
 Connects wallet, consensus, and ledger
 """
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional, Dict
 
 from ..wallet.l28_wallet import L28Wallet
@@ -13,6 +15,9 @@ from ..ledger.event import Event
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on wallet addresses kept in L28Coin's in-memory cache (LRU)
+WALLET_CACHE_MAX = 1024
+
 
 class L28Coin:
     """
@@ -25,6 +30,8 @@ class L28Coin:
         self.wallet = L28Wallet(wallet_dir)
         self.network_manager: Optional[MultiNetworkManager] = None
         self.is_running = False
+        # Wallet name -> address, LRU-bounded (avoids a JSON read per send; no key material)
+        self._address_cache: "OrderedDict[str, str]" = OrderedDict()
 
     async def start(self, networks=None, bootstrap_configs=None):
         """
@@ -52,14 +59,40 @@ class L28Coin:
 
     def create_wallet(self, name: str) -> Dict:
         """Create new L28 wallet"""
+        self.invalidate_wallet_cache(name)
         return self.wallet.create_wallet(name)
 
+    def invalidate_wallet_cache(self, name: Optional[str] = None) -> None:
+        """Drop the cached address for one wallet, or for all wallets if name is None"""
+        if name is None:
+            self._address_cache.clear()
+        else:
+            self._address_cache.pop(name, None)
+
+    def _remember_address(self, name: str, address: str) -> None:
+        self._address_cache[name] = address
+        self._address_cache.move_to_end(name)
+        if len(self._address_cache) > WALLET_CACHE_MAX:
+            self._address_cache.popitem(last=False)
+
+    def _wallet_address(self, name: str) -> str:
+        """Return the wallet's address, reading the wallet file only on a cache miss"""
+        address = self._address_cache.get(name)
+        if address is None:
+            address = self.wallet.load_wallet(name)["address"]
+        self._remember_address(name, address)
+        return address
+
     def load_wallet(self, name: str) -> Optional[Dict]:
-        """Load existing wallet"""
+        """Load existing wallet (always re-reads from disk and refreshes the cached address)"""
+        self.invalidate_wallet_cache(name)
         try:
-            return self.wallet.load_wallet(name)
+            wallet_data = self.wallet.load_wallet(name)
         except Exception:
             return None
+        if isinstance(wallet_data, dict) and "address" in wallet_data:
+            self._remember_address(name, wallet_data["address"])
+        return wallet_data
 
     async def send_transaction(
         self,
@@ -88,16 +121,14 @@ class L28Coin:
 
         # Load sender wallet
         try:
-            wallet_data = self.wallet.load_wallet(sender_wallet)
+            sender_address = self._wallet_address(sender_wallet)
         except Exception as e:
             logger.error("Wallet %s not found (%s)", sender_wallet, e)
             return False
 
-        import time
-
         # Create transaction (canonical tx.id derives from core fields)
         tx = Transaction(
-            sender=wallet_data["address"],
+            sender=sender_address,
             receiver=receiver_address,
             amount=int(amount),
             timestamp=int(time.time()),
@@ -17,6 +17,7 @@ import logging
 import time
 from collections import defaultdict
 from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
@@ -36,6 +37,17 @@ logger = logging.getLogger(__name__)
 _ISSUANCE_INIT_DISPOSABLE_TEST = "disposable_test_only"
 
 
+# Shard record encoder, configured once at import. json.dumps() with non-default
+# options builds a fresh JSONEncoder on every call; output bytes are identical.
+_RECORD_ENCODER = json.JSONEncoder(ensure_ascii=False, allow_nan=False)
+
+
+@lru_cache(maxsize=100_000)
+def _cached_address_shard(address: str, num_shards: int) -> int:
+    """Memoized stable_address_shard: hot addresses are SHA-256'd once per process."""
+    return stable_address_shard(address, num_shards)
+
+
 class BlocklessLedger:
     """
     Blockless Ledger with Sharding
@@ -88,6 +100,9 @@ class BlocklessLedger:
         self.transactions: Dict[str, Dict[str, Any]] = {}
         self._seen_tx_ids: set[str] = set()
 
+        # Per-address history index (insertion order, both sender and receiver side)
+        self._address_history: defaultdict[str, List[Dict[str, Any]]] = defaultdict(list)
+
         # Stats
         self.total_transactions = 0
         self.total_volume = 0
@@ -154,7 +169,19 @@ class BlocklessLedger:
 
     def get_shard_for_address(self, address: str) -> int:
         """Deterministic shard assignment (stable across runs / machines)."""
-        return stable_address_shard(address, self.num_shards)
+        return _cached_address_shard(str(address), self.num_shards)
+
+    @staticmethod
+    def _index_history(
+        index: defaultdict[str, List[Dict[str, Any]]], tx: Dict[str, Any]
+    ) -> None:
+        """Record tx under its sender and receiver (once for self-transfers)."""
+        sender = tx.get("sender")
+        receiver = tx.get("receiver")
+        if isinstance(sender, str):
+            index[sender].append(tx)
+        if isinstance(receiver, str) and receiver != sender:
+            index[receiver].append(tx)
 
     def _seen_tx_lookup(self, tx_id: str) -> bool:
         return tx_id in self._seen_tx_ids
@@ -274,6 +301,7 @@ class BlocklessLedger:
 
                 self.transactions[tx_id] = tx
                 self._seen_tx_ids.add(tx_id)
+                self._index_history(self._address_history, tx)
 
                 self.total_transactions += 1
                 self.total_volume += amount
@@ -308,26 +336,53 @@ class BlocklessLedger:
 
     def get_transaction_history(self, address: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
-        Get transaction history for address.
+        Get transaction history for address, newest first.
 
-        NOTE: We shard by sender, so receiver-side lookups require scanning.
-        With a small shard count this is cheap and correct.
+        Served from the per-address index, so cost scales with the address's own
+        history rather than the whole ledger. Timestamps are whole seconds, so ties
+        are broken by canonical tx id: the order is the same live and after reload.
         """
-        addr = str(address)
-        history: List[Dict[str, Any]] = []
-        for shard in self.shards:
-            for tx in shard:
-                if tx.get("sender") == addr or tx.get("receiver") == addr:
-                    history.append(tx)
-
-        history.sort(key=lambda x: int(x.get("timestamp", 0)), reverse=True)
+        history = list(self._address_history.get(str(address), ()))
+        history.sort(
+            key=lambda x: (int(x.get("timestamp", 0)), str(x.get("id", ""))),
+            reverse=True,
+        )
         return history[: int(limit)]
 
     async def _save_transaction(self, transaction: Dict[str, Any], shard_id: int) -> None:
-        """Persist transaction to disk"""
+        """
+        Persist transaction to disk.
+
+        The blocking append runs in a worker thread so the event loop keeps serving
+        other tasks. If the caller is cancelled, this still waits for the thread to
+        finish before raising CancelledError, so the ledger lock is never released
+        while an append is in flight and per-shard append order is preserved.
+        Write errors propagate to the caller; if a cancellation was also received,
+        CancelledError is raised with the write error as its cause.
+        """
         shard_file = self.data_dir / f"shard_{int(shard_id)}.jsonl"
-        with open(shard_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(transaction, ensure_ascii=False, allow_nan=False) + "\n")
+        line = _RECORD_ENCODER.encode(transaction) + "\n"
+        write = asyncio.ensure_future(asyncio.to_thread(self._append_line, shard_file, line))
+        cancelled = False
+        while not write.done():
+            try:
+                # asyncio.wait never cancels `write` and never raises its error.
+                await asyncio.wait({write})
+            except asyncio.CancelledError:
+                cancelled = True
+        try:
+            write.result()
+        except Exception as e:
+            if cancelled:
+                raise asyncio.CancelledError() from e
+            raise
+        if cancelled:
+            raise asyncio.CancelledError()
+
+    @staticmethod
+    def _append_line(path: Path, line: str) -> None:
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(line)
 
     async def load_from_disk(self) -> None:
         """
@@ -352,6 +407,7 @@ class BlocklessLedger:
             balances: defaultdict[str, int] = defaultdict(int)
             transactions: Dict[str, Dict[str, Any]] = {}
             seen_tx_ids: set[str] = set()
+            address_history: defaultdict[str, List[Dict[str, Any]]] = defaultdict(list)
             total_transactions = 0
             total_volume = 0
             issued_supply = 0
@@ -390,6 +446,7 @@ class BlocklessLedger:
                             shards[shard_id].append(tx)
                             transactions[tx_id] = tx
                             seen_tx_ids.add(tx_id)
+                            self._index_history(address_history, tx)
 
                             sender = str(tx.get("sender", ""))
                             receiver = str(tx.get("receiver", ""))
@@ -413,6 +470,7 @@ class BlocklessLedger:
                 self.balances = balances
                 self.transactions = transactions
                 self._seen_tx_ids = seen_tx_ids
+                self._address_history = address_history
                 self.total_transactions = total_transactions
                 self.total_volume = total_volume
                 self.issued_supply = issued_supply
@@ -427,6 +485,7 @@ class BlocklessLedger:
                 self.balances = defaultdict(int)
                 self.transactions = {}
                 self._seen_tx_ids = set()
+                self._address_history = defaultdict(list)
                 self.total_transactions = 0
                 self.total_volume = 0
                 self.issued_supply = 0
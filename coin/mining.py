@@ -1,17 +1,40 @@
 # SPDX-License-Identifier: Apache-2.0
 import hashlib
 import time
+from functools import lru_cache
 
 from .tx_validation import compute_tx_id, l28_coinbase_reward
 
 
+@lru_cache(maxsize=128)
+def _difficulty_bound(difficulty) -> bytes:
+    """
+    Target as a big-endian byte bound: a 32-byte digest has `difficulty` leading
+    zero hex digits iff digest < bound (one memcmp-style comparison per attempt).
+    Cached per difficulty, so repeated searches reuse the same bound object.
+    """
+    d = max(int(difficulty), 0)
+    if d == 0:
+        # 2**256 does not fit in 32 bytes; this bound sorts above every digest.
+        return b"\xff" * 32 + b"\x00"
+    if d > 64:
+        return bytes(32)
+    return (1 << (256 - 4 * d)).to_bytes(32, "big")
+
+
 def mine_block(miner_address, difficulty=18, max_attempts=10000):
-    target = "0" * difficulty
+    bound = _difficulty_bound(difficulty)
+    # Timestamp is sampled once per search, so the whole "{address}{timestamp}"
+    # prefix is invariant: absorb it once, then each attempt copies the SHA-256
+    # state and feeds only the nonce digits.
+    timestamp = time.time()
+    base = hashlib.sha256(f"{miner_address}{timestamp}".encode())
     for nonce in range(max_attempts):
-        data = f"{miner_address}{time.time()}{nonce}"
-        hash_result = hashlib.sha256(data.encode()).hexdigest()
-        if hash_result.startswith(target):
-            return {"nonce": nonce, "hash": hash_result}
+        ctx = base.copy()
+        ctx.update(b"%d" % nonce)
+        digest = ctx.digest()
+        if digest < bound:
+            return {"nonce": nonce, "hash": digest.hex(), "timestamp": timestamp}
     return None
 
 
@@ -1,30 +1,29 @@
 import hashlib
 import time
 
-def mine_bitcoin(addr, difficulty=18, max_attempts=10000):
+from .mining import _difficulty_bound
+
+def _search(coin, addr, difficulty, max_attempts):
+    # SHA-256 state over the constant "COIN:addr:" prefix, absorbed once;
+    # each attempt copies it and feeds only the nonce digits.
+    base = hashlib.sha256(f"{coin}:{addr}:".encode())
+    bound = _difficulty_bound(difficulty)
     for n in range(max_attempts):
-        h = hashlib.sha256(f"BTC:{addr}:{n}".encode()).hexdigest()
-        if h.startswith("0" * difficulty):
-            return {"coin": "BTC", "nonce": n, "hash": h}
+        ctx = base.copy()
+        ctx.update(b"%d" % n)
+        d = ctx.digest()
+        if d < bound:
+            return {"coin": coin, "nonce": n, "hash": d.hex()}
     return None
 
+def mine_bitcoin(addr, difficulty=18, max_attempts=10000):
+    return _search("BTC", addr, difficulty, max_attempts)
+
 def mine_ethereum(addr, difficulty=10, max_attempts=10000):
-    for n in range(max_attempts):
-        h = hashlib.sha256(f"ETH:{addr}:{n}".encode()).hexdigest()
-        if h.startswith("0" * difficulty):
-            return {"coin": "ETH", "nonce": n, "hash": h}
-    return None
+    return _search("ETH", addr, difficulty, max_attempts)
 
 def mine_solana(addr, difficulty=8, max_attempts=10000):
-    for n in range(max_attempts):
-        h = hashlib.sha256(f"SOL:{addr}:{n}".encode()).hexdigest()
-        if h.startswith("0" * difficulty):
-            return {"coin": "SOL", "nonce": n, "hash": h}
-    return None
+    return _search("SOL", addr, difficulty, max_attempts)
 
 def mine_l28(addr, difficulty=18, max_attempts=10000):
-    for n in range(max_attempts):
-        h = hashlib.sha256(f"L28:{addr}:{n}".encode()).hexdigest()
-        if h.startswith("0" * difficulty):
-            return {"coin": "L28", "nonce": n, "hash": h}
-    return None
+    return _search("L28", addr, difficulty, max_attempts)
@@ -0,0 +1,31 @@
+import hashlib
+import unittest
+
+from coin import mining
+
+
+class MineBlockTests(unittest.TestCase):
+    def test_result_hash_reproduces_from_returned_timestamp(self):
+        result = mining.mine_block("miner", difficulty=2, max_attempts=100_000)
+        self.assertIsNotNone(result)
+        preimage = f"miner{result['timestamp']}{result['nonce']}".encode()
+        self.assertEqual(result["hash"], hashlib.sha256(preimage).hexdigest())
+        self.assertTrue(result["hash"].startswith("00"))
+
+    def test_difficulty_bound_matches_hex_prefix_rule(self):
+        samples = [bytes(32), b"\xff" * 32, bytes(4) + b"\x0f" + b"\xff" * 27]
+        samples += [hashlib.sha256(str(i).encode()).digest() for i in range(256)]
+        for digest in samples:
+            for difficulty in range(0, 66):
+                self.assertEqual(
+                    digest < mining._difficulty_bound(difficulty),
+                    digest.hex().startswith("0" * difficulty),
+                    (digest.hex(), difficulty),
+                )
+
+    def test_exhausted_search_returns_none(self):
+        self.assertIsNone(mining.mine_block("miner", difficulty=64, max_attempts=10))
+
+
+if __name__ == "__main__":
+    unittest.main()
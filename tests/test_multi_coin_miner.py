@@ -0,0 +1,42 @@
+import hashlib
+import unittest
+
+from coin import multi_coin_miner as miner
+
+
+class MultiCoinMinerTests(unittest.TestCase):
+    def test_result_hash_matches_plain_preimage(self):
+        for fn, coin in (
+            (miner.mine_bitcoin, "BTC"),
+            (miner.mine_ethereum, "ETH"),
+            (miner.mine_solana, "SOL"),
+            (miner.mine_l28, "L28"),
+        ):
+            result = fn("addr", difficulty=2, max_attempts=100_000)
+            self.assertIsNotNone(result)
+            self.assertEqual(result["coin"], coin)
+            preimage = f"{coin}:addr:{result['nonce']}".encode()
+            self.assertEqual(result["hash"], hashlib.sha256(preimage).hexdigest())
+            self.assertTrue(result["hash"].startswith("00"))
+
+    def test_first_winning_nonce_is_returned(self):
+        result = miner.mine_l28("addr", difficulty=1, max_attempts=100_000)
+        for n in range(result["nonce"]):
+            digest = hashlib.sha256(f"L28:addr:{n}".encode()).hexdigest()
+            self.assertFalse(digest.startswith("0"))
+
+    def test_odd_difficulty_checks_high_nibble(self):
+        for difficulty in (1, 3):
+            result = miner.mine_solana("addr", difficulty=difficulty, max_attempts=1_000_000)
+            target = "0" * difficulty
+            self.assertTrue(result["hash"].startswith(target))
+            for n in range(result["nonce"]):
+                digest = hashlib.sha256(f"SOL:addr:{n}".encode()).hexdigest()
+                self.assertFalse(digest.startswith(target))
+
+    def test_exhausted_search_returns_none(self):
+        self.assertIsNone(miner.mine_l28("addr", difficulty=64, max_attempts=10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
-from coin.ledger import BlocklessLedger
+from coin.ledger import BlocklessLedger, _cached_address_shard
 from coin.mining import build_coinbase_tx, build_mint_tx
 from coin.tx_validation import (
     L28_EMISSION_CEILING,
@@ -22,6 +24,7 @@ from coin.tx_validation import (
     compute_tx_id,
     l28_coinbase_reward,
     resolve_tx_id,
+    stable_address_shard,
     strict_protocol_int,
     validate_transaction,
 )
@@ -311,6 +314,122 @@ class TestLedgerIdentityAndReplay(unittest.TestCase):
             # Reload does not grant issuance readiness by itself.
             self.assertFalse(ledger2.is_canonical_issuance_ready())
 
+    def test_history_covers_both_sides_and_survives_reload(self):
+        with tempfile.TemporaryDirectory() as td:
+            ledger = _temp_ledger(td)
+            _enable_disposable_test_issuance(ledger)
+            cb = build_coinbase_tx("alice", nonce=3, height=0, timestamp=1_700_000_000)
+            self.assertTrue(_run(ledger.add_transaction(cb)))
+            t1 = {"sender": "alice", "receiver": "bob", "amount": 2, "timestamp": 1_700_000_001}
+            t2 = {"sender": "bob", "receiver": "carol", "amount": 1, "timestamp": 1_700_000_002}
+            self.assertTrue(_run(ledger.add_transaction(t1)))
+            self.assertTrue(_run(ledger.add_transaction(t2)))
+
+            bob = [tx["id"] for tx in ledger.get_transaction_history("bob")]
+            self.assertEqual(bob, [compute_tx_id(t2), compute_tx_id(t1)])
+            self.assertEqual(len(ledger.get_transaction_history("alice")), 2)
+            self.assertEqual(len(ledger.get_transaction_history("alice", limit=1)), 1)
+            self.assertEqual(ledger.get_transaction_history("nobody"), [])
+
+            # Same-second payments from senders on different shards.
+            senders = [f"u{i}" for i in range(6)]
+            for i, name in enumerate(senders):
+                fund = {"sender": "alice", "receiver": name, "amount": 1, "timestamp": 1_700_000_010 + i}
+                self.assertTrue(_run(ledger.add_transaction(fund)))
+            self.assertGreater(len({ledger.get_shard_for_address(n) for n in senders}), 1)
+            same_second = []
+            for name in senders:
+                pay = {"sender": name, "receiver": "z", "amount": 1, "timestamp": 1_700_000_100}
+                self.assertTrue(_run(ledger.add_transaction(pay)))
+                same_second.append(compute_tx_id(pay))
+            z_live = [tx["id"] for tx in ledger.get_transaction_history("z")]
+            self.assertEqual(z_live, sorted(same_second, reverse=True))
+
+            ledger2 = _temp_ledger(td)
+            _run(ledger2.load_from_disk())
+            self.assertEqual([tx["id"] for tx in ledger2.get_transaction_history("bob")], bob)
+            self.assertEqual([tx["id"] for tx in ledger2.get_transaction_history("z")], z_live)
+
+    @staticmethod
+    def _gate_append(ledger: BlocklessLedger, *, fail: bool):
+        """Patch _append_line to block until released; returns (started, release, finished)."""
+        started, release, finished = threading.Event(), threading.Event(), threading.Event()
+        append = ledger._append_line
+
+        def gated_append(path, line):
+            started.set()
+            try:
+                if not release.wait(10):
+                    raise TimeoutError("append never released")
+                if fail:
+                    raise OSError("injected write failure")
+                append(path, line)
+            finally:
+                finished.set()
+
+        ledger._append_line = gated_append
+        return started, release, finished
+
+    def test_cancelled_add_waits_for_inflight_append(self):
+        with tempfile.TemporaryDirectory() as td:
+            ledger = _temp_ledger(td)
+            _enable_disposable_test_issuance(ledger)
+            started, release, _ = self._gate_append(ledger, fail=False)
+            cb = build_coinbase_tx("alice", nonce=4, height=0, timestamp=1_700_000_000)
+
+            async def scenario():
+                task = asyncio.create_task(ledger.add_transaction(cb))
+                self.assertTrue(await asyncio.to_thread(started.wait, 10))
+                task.cancel()
+                await asyncio.sleep(0)
+                # Cancelled, but the append is still in flight: lock stays held.
+                self.assertTrue(ledger._lock.locked())
+                release.set()
+                with self.assertRaises(asyncio.CancelledError):
+                    await task
+                self.assertFalse(ledger._lock.locked())
+                shard = Path(td) / f"shard_{ledger.get_shard_for_address('alice')}.jsonl"
+                self.assertEqual(len(shard.read_text(encoding="utf-8").splitlines()), 1)
+
+            _run(scenario())
+
+    def test_cancel_with_failing_append_is_neither_success_nor_swallowed(self):
+        # Cancel while the failing write is in flight, and after it has failed
+        # but before the coroutine resumed.
+        for cancel_after_failure in (False, True):
+            with self.subTest(cancel_after_failure=cancel_after_failure):
+                with tempfile.TemporaryDirectory() as td:
+                    ledger = _temp_ledger(td)
+                    _enable_disposable_test_issuance(ledger)
+                    started, release, finished = self._gate_append(ledger, fail=True)
+                    cb = build_coinbase_tx("alice", nonce=5, height=0, timestamp=1_700_000_000)
+
+                    async def scenario():
+                        task = asyncio.create_task(ledger.add_transaction(cb))
+                        self.assertTrue(await asyncio.to_thread(started.wait, 10))
+                        if cancel_after_failure:
+                            release.set()
+                            self.assertTrue(await asyncio.to_thread(finished.wait, 10))
+                            task.cancel()
+                        else:
+                            task.cancel()
+                            release.set()
+                        with self.assertRaises(asyncio.CancelledError) as ctx:
+                            await task
+                        self.assertIsInstance(ctx.exception.__cause__, OSError)
+                        self.assertFalse(ledger._lock.locked())
+
+                    _run(scenario())
+
+    def test_failing_append_without_cancel_rejects(self):
+        with tempfile.TemporaryDirectory() as td:
+            ledger = _temp_ledger(td)
+            _enable_disposable_test_issuance(ledger)
+            _, release, _ = self._gate_append(ledger, fail=True)
+            release.set()
+            cb = build_coinbase_tx("alice", nonce=6, height=0, timestamp=1_700_000_000)
+            self.assertFalse(_run(ledger.add_transaction(cb)))
+
     def test_legacy_mismatched_record_fails_closed_without_rewrite(self):
         with tempfile.TemporaryDirectory() as td:
             path = Path(td)
@@ -348,6 +467,22 @@ class TestLedgerIdentityAndReplay(unittest.TestCase):
             self.assertFalse(_run(ledger.add_transaction(tx)))
 
 
+class TestShardMapping(unittest.TestCase):
+    def test_shard_is_sha256_prefix_mod_count(self):
+        for addr in ("alice", "bob", "L28" + "a" * 40, "\u00e9"):
+            digest = hashlib.sha256(addr.encode("utf-8")).digest()
+            expected = int.from_bytes(digest[:8], "big") % 5
+            self.assertEqual(stable_address_shard(addr, 5), expected)
+            # Memoized ledger path must return the same placement, cold and warm.
+            self.assertEqual(_cached_address_shard(addr, 5), expected)
+            self.assertEqual(_cached_address_shard(addr, 5), expected)
+
+    def test_ledger_uses_stable_mapping(self):
+        with tempfile.TemporaryDirectory() as td:
+            ledger = _temp_ledger(td, num_shards=7)
+            self.assertEqual(ledger.get_shard_for_address("alice"), stable_address_shard("alice", 7))
+
+
 class TestCanonicalIssuanceGate(unittest.TestCase):
     def test_fresh_default_ledger_rejects_coinbase(self):
         with tempfile.TemporaryDirectory() as td: